@@ -1,255 +1,335 @@
 
-import random
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
-class CellLineClone:
-    """Represents a CHO cell clone producing a therapeutic antibody"""
-    
-    def __init__(self, clone_id, parent_line="CHO-K1"):
-        self.id = clone_id
-        self.parent = parent_line
-        
-       
-        self.base_titer = random.gauss(2.5, 1.5)  
-        self.growth_rate = random.gauss(0.032, 0.008)  
-        self.viability = random.gauss(94, 6)  
-        self.stability = random.choice([True, True, True, False])  
-        
-       
-        self.glycosylation_pattern = random.choice(['Optimal', 'Optimal', 'Good', 'Poor'])
-        self.aggregation_level = random.uniform(0.5, 8.0)  
-        
-       
-        self.base_titer = max(0.1, min(6.0, self.base_titer))
-        self.viability = max(60, min(99, self.viability))
-        self.growth_rate = max(0.015, min(0.050, self.growth_rate))
-        
-       
-        self.day0_density = 0.5e6  
-        self.day3_density = None
-        self.day7_density = None
-        self.day7_viability = None
-        self.day7_titer = None
-    
+from cell_line_kernels import compute_day7
+
+try:
+    import numexpr as ne
+    ne.set_num_threads(os.cpu_count())
+    HAVE_NUMEXPR = True
+except ImportError:
+    HAVE_NUMEXPR = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+# Glycosylation is stored as an int8 category code; strings are only
+# materialized when building the results DataFrame
+GLYCO_NAMES = np.array(['Optimal', 'Good', 'Poor'])
+GLYCO_PROBS = [0.5, 0.25, 0.25]
+GLYCO_OPTIMAL = 0
+
+# Bernoulli probability that a clone has stable expression (was the
+# old 3-True-in-4 random.choice list)
+STABILITY_P = 0.75
+
+@dataclass
+class Clones:
+    """A plate of CHO clones stored as one NumPy array per attribute.
+
+    Struct-of-arrays replacement for N individual clone objects: every
+    per-day computation runs as whole-array operations over these
+    fields.
+    """
+    ids: np.ndarray
+    base_titer: np.ndarray
+    growth_rate: np.ndarray
+    viability0: np.ndarray
+    stability: np.ndarray
+    glyco_code: np.ndarray
+    aggregation: np.ndarray
+    day0_density: np.ndarray
+    day3_density: np.ndarray = None
+    day7_density: np.ndarray = None
+    day7_viability: np.ndarray = None
+    day7_titer: np.ndarray = None
+    parent: str = "CHO-K1"
+
+    @classmethod
+    def random(cls, num_clones, rng):
+        """Draw a plate of clones in one batch of array-sized RNG calls"""
+        return cls(
+            ids=np.array([f"Clone_{i+1:03d}" for i in range(num_clones)]),
+            base_titer=np.clip(rng.normal(2.5, 1.5, num_clones), 0.1, 6.0),
+            growth_rate=np.clip(rng.normal(0.032, 0.008, num_clones), 0.015, 0.050),
+            viability0=np.clip(rng.normal(94, 6, num_clones), 60, 99),
+            # Contiguous 1-byte bools: scored as np.where masks, never as
+            # per-object Python bools
+            stability=rng.random(num_clones) < STABILITY_P,
+            glyco_code=rng.choice(3, num_clones, p=GLYCO_PROBS).astype(np.int8),
+            aggregation=rng.uniform(0.5, 8.0, num_clones),
+            day0_density=np.full(num_clones, 0.5e6),
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def glycosylation(self):
+        """Glycosylation pattern names, materialized from the codes"""
+        return np.take(GLYCO_NAMES, self.glyco_code)
+
     def grow(self, days):
-        """Simulate cell growth over time"""
-        
+        """Simulate cell growth: (density, viability) arrays for all clones"""
         time_hours = days * 24
-        peak_density = 8e6  
-        
-        density = self.day0_density * np.exp(self.growth_rate * time_hours)
-        density = min(density, peak_density)  
-        
-       
-        viability = self.viability - (days * 0.5)
-        viability = max(60, viability)
-        
+        if HAVE_NUMEXPR:
+            # Single chunked multi-threaded evaluation, no intermediate
+            # temp arrays
+            density = ne.evaluate(
+                "where(d0 * exp(gr * hours) > peak, peak, d0 * exp(gr * hours))",
+                local_dict={'d0': self.day0_density, 'gr': self.growth_rate,
+                            'hours': float(time_hours), 'peak': 8e6}
+            )
+        else:
+            density = np.minimum(self.day0_density * np.exp(self.growth_rate * time_hours), 8e6)
+        viability = np.maximum(self.viability0 - days * 0.5, 60)
         return density, viability
-    
-    def produce_antibody(self, days):
-        """Calculate antibody production (titer)"""
-        
-        density, viability = self.grow(days)
-        
-       
-        qP = self.base_titer * 10  
-        
-       
-        titer = (self.base_titer * days / 7) * (viability / 100)
-        
-       
-        titer = titer * random.gauss(1.0, 0.1)
-        
-        return max(0.1, titer)
-    
+
     def score(self):
-        """Calculate overall quality score for ranking"""
-       
-        titer_score = min(1.0, self.day7_titer / 5.0) if self.day7_titer else 0
-        viability_score = (self.day7_viability / 100) if self.day7_viability else 0
-        growth_score = min(1.0, self.growth_rate / 0.045)
-        stability_bonus = 0.2 if self.stability else 0
-        quality_bonus = 0.15 if self.glycosylation_pattern == 'Optimal' else 0
-        quality_penalty = -0.1 if self.aggregation_level > 5.0 else 0
-        
+        """Overall quality score for ranking, as an array over the plate"""
+        n = len(self)
+        titer = self.day7_titer if self.day7_titer is not None else np.zeros(n)
+        viability = self.day7_viability if self.day7_viability is not None else np.zeros(n)
+
         total_score = (
-            titer_score * 0.40 +     
-            viability_score * 0.25 +  
-            growth_score * 0.10 +     
-            stability_bonus +         
-            quality_bonus +           
-            quality_penalty           
+            np.minimum(1.0, titer / 5.0) * 0.40 +
+            (viability / 100) * 0.25 +
+            np.minimum(1.0, self.growth_rate / 0.045) * 0.10 +
+            np.where(self.stability, 0.2, 0.0) +
+            np.where(self.glyco_code == GLYCO_OPTIMAL, 0.15, 0.0) +
+            np.where(self.aggregation > 5.0, -0.1, 0.0)
         )
-        
-        return round(total_score, 3)
+
+        return np.round(total_score, 3)
 
 
 class AutomatedScreening:
     """Simulates automated high-throughput cell line screening"""
     
-    def __init__(self, num_clones=96, plate_format='96-well'):
+    def __init__(self, num_clones=96, plate_format='96-well', seed=None, verbose=True):
         self.num_clones = num_clones
         self.plate_format = plate_format
-        self.clones = [CellLineClone(f"Clone_{i+1:03d}") for i in range(num_clones)]
-        self.screening_log = []
+        self.verbose = verbose
+
+        # One PCG64 generator for the whole campaign: every draw comes
+        # off this bit-stream
+        self.rng = np.random.default_rng(seed)
+        self.clones = Clones.random(num_clones, self.rng)
+        self._log_frames = {}
         self.start_date = datetime.now()
-    
+        # Formatted once here; the per-day report headers reuse these
+        self._date_strs = {
+            day: (self.start_date + timedelta(days=day)).strftime('%Y-%m-%d')
+            for day in (0, 3, 7)
+        }
+
+    def _emit(self, lines):
+        """Write a block of report lines with one stdout call"""
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+
+    @property
+    def screening_log(self):
+        """Per-day log frames concatenated on demand (rows in day order)"""
+        if not self._log_frames:
+            return pd.DataFrame()
+        return pd.concat(
+            [self._log_frames[day] for day in sorted(self._log_frames)],
+            ignore_index=True
+        )
+
     def day_0_seed_plates(self):
         """Day 0: Robot seeds cells into plates"""
-        print("\n" + "=" * 80)
-        print("DAY 0: SEEDING CELLS")
-        print("=" * 80)
-        print(f"Date: {self.start_date.strftime('%Y-%m-%d')}")
-        print(f"\n🔬 Screening {self.num_clones} CHO cell clones for antibody production")
-        print(f"📋 Plate format: {self.plate_format}")
-        print(f"🤖 Automated liquid handling system: Hamilton STAR")
-        
-        print("\n⚙️  Protocol Steps:")
-        print("  1. Thaw cryopreserved clones from -80°C")
-        print("  2. Count viable cells (Vi-CELL analyzer)")
-        print("  3. Dilute to 0.5 × 10⁶ cells/mL")
-        print("  4. Robot dispenses 200 µL per well")
-        print("  5. Add basal media + 4 mM glutamine")
-        
-        for clone in self.clones:
-            self.screening_log.append({
-                'day': 0,
-                'clone_id': clone.id,
-                'action': 'seeded',
-                'volume_ul': 200,
-                'density_cells_ml': clone.day0_density
-            })
-        
-        print(f"\n✅ {len(self.clones)} clones seeded successfully")
-        print(f"   Initial density: {self.clones[0].day0_density:.1e} cells/mL")
-        print(f"   Media: CD CHO (chemically defined)")
-        print(f"   Conditions: 37°C, 5% CO₂, 125 rpm shaking")
-    
+        self._log_frames[0] = pd.DataFrame({
+            'day': 0,
+            'clone_id': self.clones.ids,
+            'action': 'seeded',
+            'volume_ul': 200,
+            'density_cells_ml': self.clones.day0_density
+        })
+
+        if self.verbose:
+            self._emit([
+                "\n" + "=" * 80,
+                "DAY 0: SEEDING CELLS",
+                "=" * 80,
+                f"Date: {self._date_strs[0]}",
+                f"\n🔬 Screening {self.num_clones} CHO cell clones for antibody production",
+                f"📋 Plate format: {self.plate_format}",
+                "🤖 Automated liquid handling system: Hamilton STAR",
+                "\n⚙️  Protocol Steps:",
+                "  1. Thaw cryopreserved clones from -80°C",
+                "  2. Count viable cells (Vi-CELL analyzer)",
+                "  3. Dilute to 0.5 × 10⁶ cells/mL",
+                "  4. Robot dispenses 200 µL per well",
+                "  5. Add basal media + 4 mM glutamine",
+                f"\n✅ {len(self.clones)} clones seeded successfully",
+                f"   Initial density: {self.clones.day0_density[0]:.1e} cells/mL",
+                "   Media: CD CHO (chemically defined)",
+                "   Conditions: 37°C, 5% CO₂, 125 rpm shaking",
+            ])
+
+
     def day_3_feed_and_sample(self):
         """Day 3: Robot adds feed and takes samples"""
-        print("\n" + "=" * 80)
-        print("DAY 3: FEEDING & SAMPLING")
-        print("=" * 80)
-        
-        day3_date = self.start_date + timedelta(days=3)
-        print(f"Date: {day3_date.strftime('%Y-%m-%d')}")
-        
-        print("\n⚙️  Protocol Steps:")
-        print("  1. Robot samples 50 µL from each well")
-        print("  2. Measure cell density & viability (Vi-CELL)")
-        print("  3. Add 50 µL feed media (glucose + amino acids)")
-        print("  4. Store samples at -80°C for later titer analysis")
-        
-        for clone in self.clones:
-            density, viability = clone.grow(days=3)
-            clone.day3_density = density
-            
-            self.screening_log.append({
-                'day': 3,
-                'clone_id': clone.id,
-                'action': 'fed_and_sampled',
-                'feed_volume_ul': 50,
-                'sample_volume_ul': 50,
-                'density': density,
-                'viability': viability
-            })
-        
-        avg_density = np.mean([c.day3_density for c in self.clones])
-        print(f"\n✅ All {len(self.clones)} wells processed")
-        print(f"   Average density: {avg_density:.2e} cells/mL")
-        print(f"   Expected: 2-4 × 10⁶ cells/mL (healthy growth)")
-    
+        density3, viability3 = self.clones.grow(days=3)
+        self.clones.day3_density = density3
+
+        self._log_frames[3] = pd.DataFrame({
+            'day': 3,
+            'clone_id': self.clones.ids,
+            'action': 'fed_and_sampled',
+            'feed_volume_ul': 50,
+            'sample_volume_ul': 50,
+            'density': density3,
+            'viability': viability3
+        })
+
+        if self.verbose:
+            avg_density = density3.mean()
+            self._emit([
+                "\n" + "=" * 80,
+                "DAY 3: FEEDING & SAMPLING",
+                "=" * 80,
+                f"Date: {self._date_strs[3]}",
+                "\n⚙️  Protocol Steps:",
+                "  1. Robot samples 50 µL from each well",
+                "  2. Measure cell density & viability (Vi-CELL)",
+                "  3. Add 50 µL feed media (glucose + amino acids)",
+                "  4. Store samples at -80°C for later titer analysis",
+                f"\n✅ All {len(self.clones)} wells processed",
+                f"   Average density: {avg_density:.2e} cells/mL",
+                "   Expected: 2-4 × 10⁶ cells/mL (healthy growth)",
+            ])
+
+
     def day_7_harvest_and_analyze(self):
         """Day 7: Final harvest and comprehensive analysis"""
-        print("\n" + "=" * 80)
-        print("DAY 7: HARVEST & ANALYSIS")
-        print("=" * 80)
-        
-        day7_date = self.start_date + timedelta(days=7)
-        print(f"Date: {day7_date.strftime('%Y-%m-%d')}")
-        
-        print("\n⚙️  Protocol Steps:")
-        print("  1. Robot harvests all wells (full volume)")
-        print("  2. Centrifuge to separate cells from supernatant")
-        print("  3. Measure final cell density & viability")
-        print("  4. Measure antibody titer (ELISA or Octet)")
-        print("  5. Optional: LC-MS for product quality analysis")
-        
-        
-        results = []
-        for clone in self.clones:
-            density, viability = clone.grow(days=7)
-            titer = clone.produce_antibody(days=7)
-            
-            clone.day7_density = density
-            clone.day7_viability = viability
-            clone.day7_titer = titer
-            
-            results.append({
-                'Clone ID': clone.id,
-                'Titer (g/L)': round(titer, 2),
-                'Viability (%)': round(viability, 1),
-                'VCD (10⁶ cells/mL)': round(density / 1e6, 2),
-                'Growth Rate': round(clone.growth_rate, 4),
-                'Stable': 'Yes' if clone.stability else 'No',
-                'Glycosylation': clone.glycosylation_pattern,
-                'Aggregates (%)': round(clone.aggregation_level, 1),
-                'Score': clone.score()
-            })
-        
-        df = pd.DataFrame(results)
-        
-        print(f"\n✅ Analysis complete for all {len(self.clones)} clones")
-        print(f"\n📊 SCREENING STATISTICS:")
-        print(f"   Mean Titer: {df['Titer (g/L)'].mean():.2f} g/L")
-        print(f"   Max Titer: {df['Titer (g/L)'].max():.2f} g/L")
-        print(f"   Mean Viability: {df['Viability (%)'].mean():.1f}%")
-        print(f"   High Producers (>3 g/L): {(df['Titer (g/L)'] > 3).sum()} clones")
-        print(f"   Stable Clones: {(df['Stable'] == 'Yes').sum()}/{len(df)}")
-        
+        # One fused pass over the clone arrays (Numba if available,
+        # NumPy fallback otherwise)
+        clones = self.clones
+        noise = self.rng.normal(1.0, 0.1, self.num_clones)
+        density7, viability7, titer7, scores = compute_day7(
+            clones.base_titer, clones.growth_rate, clones.viability0,
+            clones.stability, clones.glyco_code == GLYCO_OPTIMAL,
+            clones.aggregation, noise, clones.day0_density, days=7
+        )
+
+        clones.day7_density = density7
+        clones.day7_viability = viability7
+        clones.day7_titer = titer7
+
+        # Campaign statistics as single array reductions, stashed so the
+        # summary never has to go back through DataFrame columns
+        best = int(np.argmax(scores))
+        self._stats = {
+            'mean_titer': titer7.mean(),
+            'max_titer': titer7.max(),
+            'mean_viability': viability7.mean(),
+            'best_clone': clones.ids[best],
+            'high_producers': int((titer7 > 3).sum()),
+            'stable_clones': int(clones.stability.sum()),
+        }
+
+        # Columnar build: one contiguous array per column, no per-row dicts
+        df = pd.DataFrame({
+            'Clone ID': clones.ids,
+            'Titer (g/L)': np.round(titer7, 2),
+            'Viability (%)': np.round(viability7, 1),
+            'VCD (10⁶ cells/mL)': np.round(density7 / 1e6, 2),
+            'Growth Rate': np.round(clones.growth_rate, 4),
+            'Stable': np.where(clones.stability, 'Yes', 'No'),
+            'Glycosylation': clones.glycosylation,
+            'Aggregates (%)': np.round(clones.aggregation, 1),
+            'Score': scores
+        })
+        
+        if self.verbose:
+            self._emit([
+                "\n" + "=" * 80,
+                "DAY 7: HARVEST & ANALYSIS",
+                "=" * 80,
+                f"Date: {self._date_strs[7]}",
+                "\n⚙️  Protocol Steps:",
+                "  1. Robot harvests all wells (full volume)",
+                "  2. Centrifuge to separate cells from supernatant",
+                "  3. Measure final cell density & viability",
+                "  4. Measure antibody titer (ELISA or Octet)",
+                "  5. Optional: LC-MS for product quality analysis",
+                f"\n✅ Analysis complete for all {len(self.clones)} clones",
+                "\n📊 SCREENING STATISTICS:",
+                f"   Mean Titer: {self._stats['mean_titer']:.2f} g/L",
+                f"   Max Titer: {self._stats['max_titer']:.2f} g/L",
+                f"   Mean Viability: {self._stats['mean_viability']:.1f}%",
+                f"   High Producers (>3 g/L): {self._stats['high_producers']} clones",
+                f"   Stable Clones: {self._stats['stable_clones']}/{len(df)}",
+            ])
+
         return df
-    
+
+
     def select_top_clones(self, df, n=10):
         """Select top performing clones for advancement"""
-        print("\n" + "=" * 80)
-        print(f"🏆 TOP {n} CLONE SELECTION")
-        print("=" * 80)
-        
-      
-        top_clones = df.nlargest(n, 'Score')
-        
-        print("\n📋 Selection Criteria:")
-        print("   • High titer (>2.5 g/L preferred)")
-        print("   • High viability (>85%)")
-        print("   • Stable expression")
-        print("   • Good product quality (low aggregation)")
-        print("   • Optimal glycosylation pattern")
-        
-        print(f"\n🎯 SELECTED CLONES:\n")
-        print(top_clones.to_string(index=False))
-        
-        print(f"\n✅ {n} clones selected for scale-up to shake flasks")
-        print("   Next steps:")
-        print("   1. Expand in 125 mL shake flasks")
-        print("   2. Validate titer in fed-batch (14 days)")
-        print("   3. Assess stability over 60 generations")
-        print("   4. Best clone → Scale to bioreactor (2L → 200L → 2000L)")
-        
+        # O(N) partial select of the top n, then sort only those n rows
+        # (beats a full sort once plates number in the thousands)
+        scores = df['Score'].to_numpy()
+        idx = np.argpartition(-scores, min(n, len(scores) - 1))[:n]
+        idx = idx[np.argsort(-scores[idx])]
+        top_clones = df.iloc[idx]
+
+        if self.verbose:
+            self._emit([
+                "\n" + "=" * 80,
+                f"🏆 TOP {n} CLONE SELECTION",
+                "=" * 80,
+                "\n📋 Selection Criteria:",
+                "   • High titer (>2.5 g/L preferred)",
+                "   • High viability (>85%)",
+                "   • Stable expression",
+                "   • Good product quality (low aggregation)",
+                "   • Optimal glycosylation pattern",
+                "\n🎯 SELECTED CLONES:\n",
+                top_clones.to_string(index=False),
+                f"\n✅ {n} clones selected for scale-up to shake flasks",
+                "   Next steps:",
+                "   1. Expand in 125 mL shake flasks",
+                "   2. Validate titer in fed-batch (14 days)",
+                "   3. Assess stability over 60 generations",
+                "   4. Best clone → Scale to bioreactor (2L → 200L → 2000L)",
+            ])
+
         return top_clones
-    
-    def run_full_screening_campaign(self):
-        """Execute complete 7-day screening protocol"""
-        print("\n" + "=" * 80)
-        print("🧬 AUTOMATED CELL LINE SCREENING CAMPAIGN")
-        print("   Johnson & Johnson - Cell Engineering & Analytical Sciences")
-        print("=" * 80)
-        print(f"Campaign Start: {self.start_date.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Clones to Screen: {self.num_clones}")
-        print(f"Objective: Identify high-titer, stable antibody producers")
-        print("=" * 80)
-        
+
+
+    def run_full_screening_campaign(self, filename=None):
+        """Execute complete 7-day screening protocol
+
+        filename overrides where the results CSV is written; by default
+        it is named after the campaign start date.
+        """
+        if self.verbose:
+            self._emit([
+                "\n" + "=" * 80,
+                "🧬 AUTOMATED CELL LINE SCREENING CAMPAIGN",
+                "   Johnson & Johnson - Cell Engineering & Analytical Sciences",
+                "=" * 80,
+                f"Campaign Start: {self.start_date.strftime('%Y-%m-%d %H:%M:%S')}",
+                f"Clones to Screen: {self.num_clones}",
+                "Objective: Identify high-titer, stable antibody producers",
+                "=" * 80,
+            ])
+
        
         self.day_0_seed_plates()
         
@@ -264,39 +344,73 @@ class AutomatedScreening:
         
        
         end_time = datetime.now()
-        
-        print("\n" + "=" * 80)
-        print("📈 CAMPAIGN SUMMARY")
-        print("=" * 80)
-        print(f"Campaign End: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"Total Clones Screened: {self.num_clones}")
-        print(f"Clones Advanced: {len(top_clones)}")
-        print(f"Success Rate: {len(top_clones)/self.num_clones*100:.1f}%")
-        print(f"Best Titer: {results_df['Titer (g/L)'].max():.2f} g/L")
-        print(f"Best Clone: {results_df.loc[results_df['Score'].idxmax(), 'Clone ID']}")
-        
-       
-        filename = f"screening_results_{self.start_date.strftime('%Y%m%d')}.csv"
-        results_df.to_csv(filename, index=False)
-        print(f"\n💾 Results saved to: {filename}")
-        
-        print("\n" + "=" * 80)
-        print("🎓 KEY CONCEPTS DEMONSTRATED:")
-        print("=" * 80)
-        print("✅ CHO cell line development workflow")
-        print("✅ High-throughput automated screening")
-        print("✅ Titer, viability, and growth metrics")
-        print("✅ Multi-criteria clone selection")
-        print("✅ Product quality assessment")
-        print("✅ Why automation is critical (96+ clones manually = impossible!)")
-        print("\n💡 This is EXACTLY what you'll support at J&J!")
-        print("   Your automation systems enable scientists to screen")
-        print("   THOUSANDS of clones to find the best antibody producers!")
-        print("=" * 80 + "\n")
-        
+
+        if filename is None:
+            filename = f"screening_results_{self.start_date.strftime('%Y%m%d')}.csv"
+        if HAVE_PYARROW:
+            # C++ CSV writer: threaded IO and fast float formatting
+            pacsv.write_csv(pa.Table.from_pandas(results_df, preserve_index=False),
+                            filename)
+        else:
+            results_df.to_csv(filename, index=False, lineterminator='\n')
+
+        if self.verbose:
+            self._emit([
+                "\n" + "=" * 80,
+                "📈 CAMPAIGN SUMMARY",
+                "=" * 80,
+                f"Campaign End: {end_time.strftime('%Y-%m-%d %H:%M:%S')}",
+                f"Total Clones Screened: {self.num_clones}",
+                f"Clones Advanced: {len(top_clones)}",
+                f"Success Rate: {len(top_clones)/self.num_clones*100:.1f}%",
+                f"Best Titer: {self._stats['max_titer']:.2f} g/L",
+                f"Best Clone: {self._stats['best_clone']}",
+                f"\n💾 Results saved to: {filename}",
+                "\n" + "=" * 80,
+                "🎓 KEY CONCEPTS DEMONSTRATED:",
+                "=" * 80,
+                "✅ CHO cell line development workflow",
+                "✅ High-throughput automated screening",
+                "✅ Titer, viability, and growth metrics",
+                "✅ Multi-criteria clone selection",
+                "✅ Product quality assessment",
+                "✅ Why automation is critical (96+ clones manually = impossible!)",
+                "\n💡 This is EXACTLY what you'll support at J&J!",
+                "   Your automation systems enable scientists to screen",
+                "   THOUSANDS of clones to find the best antibody producers!",
+                "=" * 80 + "\n",
+            ])
+
         return results_df, top_clones
 
 
+def run_campaign(seed, num_clones=96):
+    """Run one quiet, seeded campaign (worker for parallel sweeps)"""
+    # The process pool already saturates the CPUs; don't let each
+    # worker's numexpr spawn another full-width thread pool on top
+    if HAVE_NUMEXPR:
+        ne.set_num_threads(1)
+    screening = AutomatedScreening(num_clones=num_clones, seed=seed, verbose=False)
+    # Campaigns in a sweep share a start date, so the default
+    # date-stamped CSV path would be written by every worker at once;
+    # key each worker's file by its seed instead
+    filename = (f"screening_results_"
+                f"{screening.start_date.strftime('%Y%m%d')}_c{seed:04d}.csv")
+    return screening.run_full_screening_campaign(filename=filename)
+
+
+def run_sweep(n_campaigns, num_clones=96):
+    """Run independent campaigns across all CPUs.
+
+    Campaigns share nothing, so they parallelize perfectly across
+    processes. Each worker is seeded with its campaign index, making the
+    sweep reproducible and the returned list ordered by campaign.
+    """
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(run_campaign, range(n_campaigns),
+                                 [num_clones] * n_campaigns))
+
+
 def main():
     """Run the cell line screening simulation"""
     